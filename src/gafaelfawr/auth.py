@@ -95,11 +95,14 @@ class AuthErrorChallenge(AuthChallenge):
         # Strip invalid characters from the description.
         error_description = re.sub(r'["\\]', "", self.error_description)
 
-        info = f'realm="{self.realm}", error="{self.error.name}"'
-        info += f', error_description="{error_description}"'
+        header = (
+            f'{self.auth_type.name} realm="{self.realm}",'
+            f' error="{self.error.name}",'
+            f' error_description="{error_description}"'
+        )
         if self.scope:
-            info += f', scope="{self.scope}"'
-        return f"{self.auth_type.name} {info}"
+            header += f', scope="{self.scope}"'
+        return header
 
 
 def generate_challenge(
@@ -272,23 +275,33 @@ def parse_authorization(context: RequestContext) -> Optional[str]:
     # Parse the header and handle Bearer.
     if not header:
         return None
-    if " " not in header:
+
+    # Fast path for the overwhelmingly common case of a Bearer token with
+    # canonical capitalization, skipping the general parsing below.
+    if header.startswith("Bearer "):
+        context.rebind_logger(token_source="bearer")
+        return header[len("Bearer ") :]
+
+    auth_type, sep, auth_blob = header.partition(" ")
+    if not sep:
         raise InvalidRequestError("Malformed Authorization header")
-    auth_type, auth_blob = header.split(" ")
-    if auth_type.lower() == "bearer":
+    auth_type_lower = auth_type.lower()
+    if auth_type_lower == "bearer":
         context.rebind_logger(token_source="bearer")
         return auth_blob
 
     # The only remaining permitted authentication type is (possibly) basic.
-    if auth_type.lower() != "basic":
+    if auth_type_lower != "basic":
         raise InvalidRequestError(f"Unknown Authorization type {auth_type}")
 
     # Basic, the complicated part because we are very flexible.
     try:
         basic_auth = base64.b64decode(auth_blob).decode()
-        user, password = basic_auth.strip().split(":")
     except Exception as e:
         raise InvalidRequestError(f"Invalid Basic auth string: {str(e)}")
+    user, sep, password = basic_auth.strip().partition(":")
+    if not sep:
+        raise InvalidRequestError("Invalid Basic auth string: no colon")
     if password == "x-oauth-basic":
         context.rebind_logger(token_source="basic-username")
         return user
@@ -12,7 +12,6 @@ from __future__ import annotations
 import json
 import logging
 import os
-import re
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import timedelta
@@ -21,6 +20,7 @@ from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 import yaml
+from cachetools import LRUCache
 from pydantic import (
     AnyHttpUrl,
     BaseModel,
@@ -32,7 +32,7 @@ from pydantic import (
 from pydantic.env_settings import SettingsSourceCallable
 from safir.logging import configure_logging
 
-from gafaelfawr.constants import SCOPE_REGEX, USERNAME_REGEX
+from gafaelfawr.constants import SCOPE_PATTERN, USERNAME_PATTERN
 from gafaelfawr.keypair import RSAKeyPair
 from gafaelfawr.models.token import Token
 
@@ -54,6 +54,16 @@ __all__ = [
     "VerifierConfig",
 ]
 
+_KEYPAIR_CACHE: LRUCache[bytes, RSAKeyPair] = LRUCache(4)
+"""Cache of parsed issuer key pairs, keyed by the private key PEM.
+
+Parsing and validating an RSA private key is relatively slow, and the
+configuration is reloaded from scratch whenever the settings path changes
+even though the key itself rarely does.  (The application graph is a
+process-global singleton, so outside of the test suite this only matters
+at startup.)
+"""
+
 
 class IssuerSettings(BaseModel):
     """pydantic model of issuer configuration."""
@@ -273,14 +283,14 @@ class Settings(BaseSettings):
 
     @validator("initial_admins", each_item=True)
     def _validate_initial_admins(cls, v: str) -> str:
-        if not re.match(USERNAME_REGEX, v):
+        if not USERNAME_PATTERN.match(v):
             raise ValueError("invalid username")
         return v
 
     @validator("known_scopes")
     def _valid_known_scopes(cls, v: Dict[str, str]) -> Dict[str, str]:
         for scope in v.keys():
-            if not re.match(SCOPE_REGEX, scope):
+            if not SCOPE_PATTERN.match(scope):
                 raise ValueError(f"invalid scope {scope}")
         for required in ("admin:token", "user:token"):
             if required not in v:
@@ -611,13 +621,19 @@ class Config:
         config : `Config`
             The corresponding Config object.
         """
+        # Use the libyaml C loader when available, since it is substantially
+        # faster than the pure-Python one.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(path, "r") as f:
-            raw_settings = yaml.safe_load(f)
+            raw_settings = yaml.load(f, Loader=loader)
         settings = Settings.parse_obj(raw_settings)
 
         # Load the secrets from disk.
         key = cls._load_secret(settings.issuer.key_file)
-        keypair = RSAKeyPair.from_pem(key)
+        keypair = _KEYPAIR_CACHE.get(key)
+        if not keypair:
+            keypair = RSAKeyPair.from_pem(key)
+            _KEYPAIR_CACHE[key] = keypair
         session_secret = cls._load_secret(settings.session_secret_file)
         redis_password = None
         if settings.redis_password_file:
@@ -1,5 +1,10 @@
 """Constants for Gafaelfawr."""
 
+import re
+
+ADMIN_CACHE_LIFETIME = 30
+"""How long (in seconds) to cache the set of administrators."""
+
 ALGORITHM = "RS256"
 """JWT algorithm to use for all tokens."""
 
@@ -9,6 +14,15 @@ COOKIE_NAME = "gafaelfawr"
 HTTP_TIMEOUT = 10.0
 """Timeout (in seconds) for outbound HTTP requests to auth providers."""
 
+ISSUER_KEY_CACHE_LIFETIME = 600
+"""How long (in seconds) to cache issuer public keys."""
+
+ISSUER_KEY_CACHE_SIZE = 16
+"""How many issuer public keys to cache in memory."""
+
+KUBERNETES_CHECK_CONCURRENCY = 10
+"""How many Kubernetes service token checks to run concurrently."""
+
 KUBERNETES_TOKEN_TYPE_LABEL = "gafaelfawr.lsst.io/token-type"
 """Label storing the token type of Gafaelfawr-managed secrets."""
 
@@ -24,6 +38,12 @@ SETTINGS_PATH = "/etc/gafaelfawr/gafaelfawr.yaml"
 TOKEN_CACHE_SIZE = 10000
 """How many internal and notebook tokens to cache in memory."""
 
+VERIFIED_JWT_CACHE_LIFETIME = 5
+"""How long (in seconds) to cache verified JWTs."""
+
+VERIFIED_JWT_CACHE_SIZE = 10000
+"""How many verified JWTs to cache in memory."""
+
 # The following constants are used for field validation.  Minimum and maximum
 # length are handled separately.
 
@@ -41,3 +61,12 @@ USERNAME_REGEX = "^[a-z0-9](?:[a-z0-9]|-[a-z0-9])*$"
 
 ACTOR_REGEX = f"{USERNAME_REGEX}|^<[a-z]+>$"
 """"Regex matching all valid actors (including ``<bootstrap>``)."""
+
+# Compiled forms of the regexes above, for validation done outside of a
+# pydantic model.  (pydantic requires the uncompiled string form.)
+
+SCOPE_PATTERN = re.compile(SCOPE_REGEX)
+"""Compiled regex matching a valid scope."""
+
+USERNAME_PATTERN = re.compile(USERNAME_REGEX)
+"""Compiled regex matching all valid usernames."""
@@ -51,20 +51,26 @@ class RequestContext:
     http_client: AsyncClient
     """Shared HTTP client."""
 
+    _factory: Optional[ComponentFactory] = None
+    """Cached component factory, created on first access."""
+
     @property
     def factory(self) -> ComponentFactory:
         """A factory for constructing Gafaelfawr components.
 
-        This is constructed on the fly at each reference to ensure that we get
-        the latest logger, which may have additional bound context.
+        This is constructed on first access and then reused for the rest of
+        the request.  The cached factory is discarded when the logger is
+        rebound so that components always see the latest bound context.
         """
-        return ComponentFactory(
-            config=self.config,
-            redis=self.redis,
-            session=db.session,
-            http_client=self.http_client,
-            logger=self.logger,
-        )
+        if not self._factory:
+            self._factory = ComponentFactory(
+                config=self.config,
+                redis=self.redis,
+                session=db.session,
+                http_client=self.http_client,
+                logger=self.logger,
+            )
+        return self._factory
 
     @property
     def state(self) -> State:
@@ -88,6 +94,7 @@ class RequestContext:
             Additional values that should be added to the logging context.
         """
         self.logger = self.logger.bind(**values)
+        self._factory = None
 
 
 def context_dependency(
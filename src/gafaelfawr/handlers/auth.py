@@ -153,12 +153,14 @@ def auth_config(
     if notebook and delegate_to:
         msg = "delegate_to cannot be set for notebook tokens"
         raise InvalidDelegateToError(msg)
+    scopes = set(scope)
     if delegate_scope:
         delegate_scopes = [s.strip() for s in delegate_scope.split(",")]
+        scopes.update(delegate_scopes)
     else:
         delegate_scopes = []
     return AuthConfig(
-        scopes=set(scope) | set(delegate_scopes),
+        scopes=scopes,
         satisfy=satisfy,
         auth_type=auth_type,
         notebook=notebook,
@@ -250,11 +252,15 @@ async def get_auth(
     WWW-Authenticate
         If the request is unauthenticated, this header will be set.
     """
-    # Determine whether the request is authorized.
+    # Determine whether the request is authorized.  Parse the token scopes
+    # into a set once so that each membership test is O(1), and use
+    # generators so that the check short-circuits on the first definitive
+    # answer.
+    token_scopes = set(token_data.scopes)
     if auth_config.satisfy == Satisfy.ANY:
-        authorized = any([s in token_data.scopes for s in auth_config.scopes])
+        authorized = any(s in token_scopes for s in auth_config.scopes)
     else:
-        authorized = all([s in token_data.scopes for s in auth_config.scopes])
+        authorized = all(s in token_scopes for s in auth_config.scopes)
 
     # If not authorized, log and raise the appropriate error.
     if not authorized:
@@ -364,7 +370,7 @@ async def build_success_headers(
     if token_data.uid:
         headers["X-Auth-Request-Uid"] = str(token_data.uid)
     if token_data.groups:
-        groups = ",".join([g.name for g in token_data.groups])
+        groups = ",".join(g.name for g in token_data.groups)
         headers["X-Auth-Request-Groups"] = groups
 
     if auth_config.notebook:
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import base64
-import os
+import secrets
 from typing import TYPE_CHECKING, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -135,7 +134,7 @@ async def redirect_to_provider(
     # requests.
     state = context.state.state
     if not state:
-        state = base64.urlsafe_b64encode(os.urandom(16)).decode()
+        state = secrets.token_urlsafe(16)
         context.state.state = state
 
     # Get the authentication provider URL send the user there.
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import time
-from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
 import jwt
@@ -58,13 +57,12 @@ class TokenIssuer:
         token : `gafaelfawr.models.oidc.OIDCVerifiedToken`
             The new token.
         """
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(minutes=self._config.exp_minutes)
+        now = int(time.time())
         payload = {
             "aud": self._config.aud,
-            "iat": int(now.timestamp()),
+            "iat": now,
             "iss": self._config.iss,
-            "exp": int(expires.timestamp()),
+            "exp": now + self._config.exp_minutes * 60,
             "name": user_info.name,
             "preferred_username": user_info.username,
             "sub": user_info.username,
@@ -98,14 +96,14 @@ class TokenIssuer:
             username = self._config.influxdb_username
         else:
             username = token_data.username
+        now = int(time.time())
         if token_data.expires:
-            expires = token_data.expires
+            expires = int(token_data.expires.timestamp())
         else:
-            now = datetime.now(timezone.utc)
-            expires = now + timedelta(minutes=self._config.exp_minutes)
+            expires = now + self._config.exp_minutes * 60
         payload = {
-            "exp": int(expires.timestamp()),
-            "iat": int(time.time()),
+            "exp": expires,
+            "iat": now,
             "username": username,
         }
         return jwt.encode(payload, secret, algorithm="HS256")
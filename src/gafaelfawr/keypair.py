@@ -79,6 +79,7 @@ class RSAKeyPair:
     ) -> None:
         self.private_key = private_key
         self._private_key_as_pem: Optional[bytes] = None
+        self._public_key: Optional[rsa.RSAPublicKey] = None
         self._public_key_as_pem: Optional[bytes] = None
 
     def private_key_as_pem(self) -> bytes:
@@ -120,6 +121,19 @@ class RSAKeyPair:
         )
         return JWKS(keys=[jwk])
 
+    def public_key(self) -> rsa.RSAPublicKey:
+        """Return the public key of this key pair.
+
+        Returns
+        -------
+        key : `cryptography.hazmat.primitives.asymmetric.rsa.RSAPublicKey`
+            The public key, suitable for passing directly to JWT verification
+            without reparsing the PEM encoding.
+        """
+        if not self._public_key:
+            self._public_key = self.private_key.public_key()
+        return self._public_key
+
     def public_key_as_pem(self) -> bytes:
         """Return the PEM-encoded public key.
 
@@ -129,8 +143,7 @@ class RSAKeyPair:
             The public key in PEM encoding and SubjectPublicKeyInfo format.
         """
         if not self._public_key_as_pem:
-            public_key = self.private_key.public_key()
-            self._public_key_as_pem = public_key.public_bytes(
+            self._public_key_as_pem = self.public_key().public_bytes(
                 Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
             )
         return self._public_key_as_pem
@@ -143,4 +156,4 @@ class RSAKeyPair:
         nums : `cryptography.hazmat.primitives.asymmetric.rsa.RSAPublicNumbers`
             The public numbers.
         """
-        return self.private_key.public_key().public_numbers()
+        return self.public_key().public_numbers()
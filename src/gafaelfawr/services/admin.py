@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
+from cachetools import TTLCache
+
+from gafaelfawr.constants import ADMIN_CACHE_LIFETIME
 from gafaelfawr.exceptions import PermissionDeniedError
 from gafaelfawr.models.admin import Admin
 from gafaelfawr.models.history import AdminChange, AdminHistoryEntry
+from gafaelfawr.util import current_datetime
 
 if TYPE_CHECKING:
-    from typing import List
+    from typing import FrozenSet, List
 
     from gafaelfawr.storage.admin import AdminStore
     from gafaelfawr.storage.history import AdminHistoryStore
@@ -30,8 +33,20 @@ class AdminService:
         The backing store for history of changes to token administrators.
     transaction_manager : `gafaelfawr.storage.transaction.TransactionManager`
         Database transaction manager.
+
+    Notes
+    -----
+    The set of administrator usernames is cached briefly so that
+    `is_admin` doesn't require a database query for every check.  The cache
+    storage is process-global and is invalidated whenever an administrator is
+    added or removed through this service.
     """
 
+    _admin_cache: TTLCache[str, FrozenSet[str]] = TTLCache(
+        1, ADMIN_CACHE_LIFETIME
+    )
+    """Shared cache of administrator usernames, global to each process."""
+
     def __init__(
         self,
         admin_store: AdminStore,
@@ -67,11 +82,12 @@ class AdminService:
             action=AdminChange.add,
             actor=actor,
             ip_address=ip_address,
-            event_time=datetime.now(timezone.utc),
+            event_time=current_datetime(),
         )
         with self._transaction_manager.transaction():
             self._admin_store.add(admin)
             self._admin_history_store.add(history_entry)
+        self._admin_cache.clear()
 
     def delete_admin(
         self, username: str, *, actor: str, ip_address: str
@@ -106,7 +122,7 @@ class AdminService:
             action=AdminChange.remove,
             actor=actor,
             ip_address=ip_address,
-            event_time=datetime.now(timezone.utc),
+            event_time=current_datetime(),
         )
         with self._transaction_manager.transaction():
             if self.get_admins() == [admin]:
@@ -114,6 +130,7 @@ class AdminService:
             result = self._admin_store.delete(admin)
             if result:
                 self._admin_history_store.add(history_entry)
+        self._admin_cache.clear()
         return result
 
     def get_admins(self) -> List[Admin]:
@@ -122,4 +139,8 @@ class AdminService:
 
     def is_admin(self, username: str) -> bool:
         """Returns whether the given user is a token administrator."""
-        return any((username == a.username for a in self.get_admins()))
+        admins = self._admin_cache.get("admins")
+        if admins is None:
+            admins = frozenset(a.username for a in self.get_admins())
+            self._admin_cache["admins"] = admins
+        return username in admins
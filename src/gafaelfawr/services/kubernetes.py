@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from base64 import b64decode
 from typing import TYPE_CHECKING
 
 from gafaelfawr.config import KubernetesConfig
+from gafaelfawr.constants import KUBERNETES_CHECK_CONCURRENCY
 from gafaelfawr.exceptions import KubernetesError
 from gafaelfawr.models.token import (
     AdminTokenRequest,
@@ -16,6 +18,7 @@ from gafaelfawr.models.token import (
 from gafaelfawr.storage.kubernetes import SecretType
 
 if TYPE_CHECKING:
+    from kubernetes.client import V1Secret
     from structlog.stdlib import BoundLogger
 
     from gafaelfawr.config import ServiceSecret
@@ -74,16 +77,40 @@ class KubernetesService:
             self._logger.error(msg, error=str(e))
             raise
 
-        # Remove any secrets that shouldn't exist and update any secrets that
-        # already exist.
+        # Remove any secrets that shouldn't exist and collect the ones that
+        # already exist and need their tokens checked.  The initial list
+        # already retrieved the contents of every secret, so pass each secret
+        # along rather than fetching it again from the API server.
+        to_check = []
         for secret in secrets:
             name = secret.metadata.name
             namespace = secret.metadata.namespace
             if (name, namespace) not in wanted:
                 self._delete_service_secret(name, namespace)
             else:
-                await self._update_service_secret(wanted[(name, namespace)])
-                del wanted[(name, namespace)]
+                to_check.append((wanted.pop((name, namespace)), secret))
+
+        # Checking an existing secret requires a Redis round trip per token,
+        # so run the checks concurrently (bounded so that a large cluster
+        # doesn't open too many simultaneous connections) rather than paying
+        # each network latency serially.  Token creation shares a database
+        # session, so do any required replacements serially afterwards.
+        semaphore = asyncio.Semaphore(KUBERNETES_CHECK_CONCURRENCY)
+
+        async def needs_update(
+            service_secret: ServiceSecret, secret: V1Secret
+        ) -> bool:
+            async with semaphore:
+                return await self._service_secret_needs_update(
+                    service_secret, secret
+                )
+
+        results = await asyncio.gather(
+            *(needs_update(s, k) for s, k in to_check)
+        )
+        for (service_secret, _), update in zip(to_check, results):
+            if update:
+                await self._update_service_secret(service_secret)
 
         # Create any secrets that we're missing.
         for missing_secret in wanted.values():
@@ -98,7 +125,7 @@ class KubernetesService:
             return False
         if token_data.username != service_secret.service:
             return False
-        if sorted(token_data.scopes) != sorted(service_secret.scopes):
+        if set(token_data.scopes) != set(service_secret.scopes):
             return False
         return True
 
@@ -145,43 +172,26 @@ class KubernetesService:
         else:
             self._logger.info(f"Deleted {namespace}/{name} secret")
 
-    async def _update_service_secret(
-        self, service_secret: ServiceSecret
-    ) -> None:
-        """Verify that a service secret is still correct.
-
-        This checks that the service token is still valid and replaces it with
-        a new one if not.
-        """
-        name = service_secret.secret_name
-        namespace = service_secret.secret_namespace
-        try:
-            secret = self._storage.get_secret(
-                name, namespace, SecretType.service
-            )
-        except KubernetesError as e:
-            msg = f"Updating {namespace}/{name} failed"
-            self._logger.error(msg, error=str(e))
-            return
-        if not secret:
-            self._logger.error(
-                f"Updating {namespace}/{name} failed",
-                error=f"Secret {namespace}/{name} not found while updating",
-            )
-            return
-
-        valid = False
+    async def _service_secret_needs_update(
+        self, service_secret: ServiceSecret, secret: V1Secret
+    ) -> bool:
+        """Check whether an existing service secret needs a new token."""
         if "token" in secret.data:
             try:
                 token_str = b64decode(secret.data["token"]).decode()
                 token = Token.from_str(token_str)
-                valid = await self._check_service_token(token, service_secret)
+                if await self._check_service_token(token, service_secret):
+                    return False
             except Exception:
-                valid = False
-        if valid:
-            return
+                pass
+        return True
 
-        # The token is not valid.  Replace the secret.
+    async def _update_service_secret(
+        self, service_secret: ServiceSecret
+    ) -> None:
+        """Replace the token of a service secret with a fresh one."""
+        name = service_secret.secret_name
+        namespace = service_secret.secret_namespace
         token = await self._create_service_token(service_secret)
         try:
             self._storage.patch_secret(name, namespace, token)
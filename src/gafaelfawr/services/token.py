@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import ipaddress
-import re
 import time
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
-from gafaelfawr.constants import MINIMUM_LIFETIME, USERNAME_REGEX
+from gafaelfawr.constants import MINIMUM_LIFETIME, USERNAME_PATTERN
 from gafaelfawr.exceptions import (
     InvalidExpiresError,
     InvalidIPAddressError,
@@ -1139,5 +1138,5 @@ class TokenService:
             The username is invalid or the authenticated user doesn't have
             permission to manipulate tokens for that user.
         """
-        if not re.match(USERNAME_REGEX, username):
+        if not USERNAME_PATTERN.match(username):
             raise PermissionDeniedError(f"Invalid username: {username}")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import base64
-import os
+import secrets
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -151,4 +151,4 @@ def number_to_base64(data: int) -> bytes:
 
 def random_128_bits() -> str:
     """Generate random 128 bits encoded in base64 without padding."""
-    return base64.urlsafe_b64encode(os.urandom(16)).decode().rstrip("=")
+    return secrets.token_urlsafe(16)
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
+import time
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
 import jwt
+from cachetools import TTLCache
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
 from httpx import RequestError
-from jwt.exceptions import InvalidIssuerError
-
-from gafaelfawr.constants import ALGORITHM
+from jwt.exceptions import DecodeError, InvalidIssuerError
+
+from gafaelfawr.constants import (
+    ALGORITHM,
+    ISSUER_KEY_CACHE_LIFETIME,
+    ISSUER_KEY_CACHE_SIZE,
+    VERIFIED_JWT_CACHE_LIFETIME,
+    VERIFIED_JWT_CACHE_SIZE,
+)
 from gafaelfawr.exceptions import (
     FetchKeysException,
     InvalidTokenClaimsException,
@@ -22,10 +32,10 @@ from gafaelfawr.exceptions import (
     UnknownKeyIdException,
 )
 from gafaelfawr.models.oidc import OIDCVerifiedToken
-from gafaelfawr.util import base64_to_number
+from gafaelfawr.util import add_padding, base64_to_number
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Mapping, Optional
+    from typing import Any, Dict, List, Mapping, Optional, Tuple
 
     from httpx import AsyncClient
     from structlog.stdlib import BoundLogger
@@ -50,8 +60,27 @@ class TokenVerifier:
         The client to use for making requests.
     logger : `structlog.BoundLogger`
         Logger to use to report status information.
+
+    Notes
+    -----
+    Issuer public keys are cached in memory so that the issuer's JWKS doesn't
+    have to be retrieved over HTTP for every verification.  The cache entries
+    expire so that issuer key rotation is picked up without a restart.  As
+    with `~gafaelfawr.token_cache.TokenCache`, the cache storage is
+    process-global and isn't protected by a lock, which assumes a
+    single-process asyncio server.
     """
 
+    _key_cache: TTLCache[Tuple[str, str], rsa.RSAPublicKey] = TTLCache(
+        ISSUER_KEY_CACHE_SIZE, ISSUER_KEY_CACHE_LIFETIME
+    )
+    """Shared cache of issuer public keys, global to each process."""
+
+    _token_cache: TTLCache[bytes, OIDCVerifiedToken] = TTLCache(
+        VERIFIED_JWT_CACHE_SIZE, VERIFIED_JWT_CACHE_LIFETIME
+    )
+    """Shared cache of verified internal tokens, global to each process."""
+
     def __init__(
         self,
         config: VerifierConfig,
@@ -82,17 +111,34 @@ class TokenVerifier:
             be verified.
         gafaelfawr.exceptions.MissingClaimsException
             The token is missing required claims.
+
+        Notes
+        -----
+        Verified tokens are cached briefly, keyed by a BLAKE2b hash of the
+        encoded token, so that repeated requests with the same token don't
+        each pay for an RSA signature verification.  Only the expiration is
+        rechecked on a cache hit, and tokens that fail verification are never
+        cached.
         """
+        key = hashlib.blake2b(token.encoded.encode(), digest_size=16).digest()
+        verified_token = self._token_cache.get(key)
+        if verified_token:
+            if verified_token.claims["exp"] > time.time():
+                return verified_token
         try:
+            # PyJWT annotates the key as str, but it also accepts loaded key
+            # objects, which avoids reparsing the PEM on every verification.
             payload = jwt.decode(
                 token.encoded,
-                self._config.keypair.public_key_as_pem().decode(),
+                self._config.keypair.public_key(),  # type: ignore[arg-type]
                 algorithms=[ALGORITHM],
                 audience=self._config.aud,
             )
         except jwt.InvalidTokenError as e:
             raise InvalidTokenError(str(e))
-        return self._build_token(token.encoded, payload)
+        verified_token = self._build_token(token.encoded, payload)
+        self._token_cache[key] = verified_token
+        return verified_token
 
     async def verify_oidc_token(self, token: OIDCToken) -> OIDCVerifiedToken:
         """Verifies the provided JWT from an OpenID Connect provider.
@@ -115,11 +161,16 @@ class TokenVerifier:
             The token failed to verify or was invalid in some way.
         """
         unverified_header = jwt.get_unverified_header(token.encoded)
-        unverified_token = jwt.decode(
-            token.encoded,
-            algorithms=[ALGORITHM],
-            options={"verify_signature": False},
-        )
+
+        # Only the issuer and optionally the jti are needed before the
+        # verified decode, so peek at just the payload segment rather than
+        # running the whole token through a second unverified jwt.decode.
+        try:
+            payload = token.encoded.split(".", 2)[1]
+            decoded_payload = base64.urlsafe_b64decode(add_padding(payload))
+            unverified_token = json.loads(decoded_payload)
+        except Exception as e:
+            raise DecodeError(f"Invalid token payload: {str(e)}")
         if "iss" not in unverified_token:
             raise InvalidIssuerError("No iss claim in token")
         issuer_url = unverified_token["iss"]
@@ -143,10 +194,13 @@ class TokenVerifier:
                 msg = f"kid {key_id} not allowed for {issuer_url}"
                 raise UnknownKeyIdException(msg)
 
-        key = await self._get_key_as_pem(issuer_url, key_id)
+        key = await self._get_key(issuer_url, key_id)
+
+        # The type: ignore works around PyJWT's incomplete annotations,
+        # which don't allow key objects.
         payload = jwt.decode(
             token.encoded,
-            key,
+            key,  # type: ignore[arg-type]
             algorithms=[ALGORITHM],
             audience=self._config.oidc_aud,
         )
@@ -175,18 +229,20 @@ class TokenVerifier:
         gafaelfawr.exceptions.MissingClaimsException
             The token is missing required claims.
         """
-        if self._config.username_claim not in claims:
-            msg = f"No {self._config.username_claim} claim in token"
+        username_claim = self._config.username_claim
+        uid_claim = self._config.uid_claim
+        if username_claim not in claims:
+            msg = f"No {username_claim} claim in token"
             self._logger.warning(msg, claims=claims)
             raise MissingClaimsException(msg)
-        if self._config.uid_claim not in claims:
-            msg = f"No {self._config.uid_claim} claim in token"
+        if uid_claim not in claims:
+            msg = f"No {uid_claim} claim in token"
             self._logger.warning(msg, claims=claims)
             raise MissingClaimsException(msg)
         try:
-            uid = int(claims[self._config.uid_claim])
+            uid = int(claims[uid_claim])
         except Exception:
-            msg = f"Invalid {self._config.uid_claim} claim in token"
+            msg = f"Invalid {uid_claim} claim in token"
             self._logger.warning(msg, claims=claims)
             raise InvalidTokenClaimsException(msg)
 
@@ -194,14 +250,17 @@ class TokenVerifier:
             encoded=encoded,
             claims=claims,
             jti=claims.get("jti", "UNKNOWN"),
-            username=claims[self._config.username_claim],
+            username=claims[username_claim],
             uid=uid,
         )
 
-    async def _get_key_as_pem(self, issuer_url: str, key_id: str) -> str:
+    async def _get_key(self, issuer_url: str, key_id: str) -> rsa.RSAPublicKey:
         """Get the key for an issuer.
 
-        Gets a key as PEM, given the issuer and the request key ID.
+        Gets a public key, given the issuer and the request key ID.  The
+        result is cached as a loaded key object, so the issuer's JWKS is only
+        retrieved when the key isn't already known and the key doesn't have
+        to be reparsed for each verification.
 
         Parameters
         ----------
@@ -212,8 +271,8 @@ class TokenVerifier:
 
         Returns
         -------
-        key : `bytes`
-            The issuer's key in PEM format.
+        key : `cryptography.hazmat.primitives.asymmetric.rsa.RSAPublicKey`
+            The issuer's public key.
 
         Raises
         ------
@@ -226,6 +285,10 @@ class TokenVerifier:
             The requested key ID was not present in the issuer configuration
             or was not found in that issuer's JWKS.
         """
+        cached_key = self._key_cache.get((issuer_url, key_id))
+        if cached_key:
+            return cached_key
+
         self._logger.debug("Getting key %s from %s", key_id, issuer_url)
 
         # Retrieve the JWKS information.
@@ -246,20 +309,18 @@ class TokenVerifier:
             )
             raise UnknownAlgorithmException(msg)
 
-        # Convert and return the key.
+        # Convert, cache, and return the key.
         e = base64_to_number(key["e"])
         m = base64_to_number(key["n"])
         public_key = self._build_public_key(e, m)
+        self._key_cache[(issuer_url, key_id)] = public_key
         return public_key
 
     @staticmethod
-    def _build_public_key(exponent: int, modulus: int) -> str:
-        """Convert an exponent and modulus to a PEM-encoded key."""
+    def _build_public_key(exponent: int, modulus: int) -> rsa.RSAPublicKey:
+        """Convert an exponent and modulus to a public key object."""
         components = rsa.RSAPublicNumbers(exponent, modulus)
-        public_key = components.public_key(backend=default_backend())
-        return public_key.public_bytes(
-            encoding=Encoding.PEM, format=PublicFormat.SubjectPublicKeyInfo
-        ).decode()
+        return components.public_key(backend=default_backend())
 
     async def _get_keys(self, issuer_url: str) -> List[Dict[str, str]]:
         """Fetch the key set for an issuer.
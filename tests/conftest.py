@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import kubernetes
 import pytest
@@ -26,9 +26,13 @@ if TYPE_CHECKING:
 
 
 @pytest.fixture(scope="session")
-def driver() -> Iterator[webdriver.Chrome]:
+def session_driver() -> Iterator[webdriver.Chrome]:
     """Create a driver for Selenium testing.
 
+    Chrome startup takes several seconds, so the browser is started once per
+    test session.  Tests should use the `driver` fixture instead, which
+    resets browser state between tests.
+
     Returns
     -------
     driver : `selenium.webdriver.Chrome`
@@ -42,11 +46,32 @@ def driver() -> Iterator[webdriver.Chrome]:
 
 
 @pytest.fixture
-def mock_kubernetes() -> Iterator[MockCoreV1Api]:
+def driver(session_driver: webdriver.Chrome) -> webdriver.Chrome:
+    """Reset the session web driver for a new test.
+
+    Clears any header overrides, cookies, and local storage left behind by a
+    previous test so that each test starts with a clean browser without
+    paying for a Chrome relaunch.
+
+    Returns
+    -------
+    driver : `selenium.webdriver.Chrome`
+        The web driver to use in Selenium tests.
+    """
+    session_driver.header_overrides = {}
+    session_driver.delete_all_cookies()
+    if session_driver.current_url.startswith("http"):
+        # localStorage isn't accessible from the browser's initial page.
+        session_driver.execute_script("window.localStorage.clear();")
+    return session_driver
+
+
+@pytest.fixture
+def mock_kubernetes(monkeypatch: pytest.MonkeyPatch) -> MockCoreV1Api:
     MockCoreV1Api.reset_for_test()
-    with patch.object(kubernetes, "config"):
-        with patch.object(kubernetes.client, "CoreV1Api", MockCoreV1Api):
-            yield MockCoreV1Api()
+    monkeypatch.setattr(kubernetes, "config", MagicMock())
+    monkeypatch.setattr(kubernetes.client, "CoreV1Api", MockCoreV1Api)
+    return MockCoreV1Api()
 
 
 @pytest.fixture
@@ -56,3 +56,17 @@ def test_delete(setup: SetupTest) -> None:
         "other", actor="<bootstrap>", ip_address="127.0.0.1"
     )
     assert admin_service.get_admins() == [Admin(username="example")]
+
+
+def test_caching(setup: SetupTest) -> None:
+    admin_service = setup.factory.create_admin_service()
+
+    # Warm the administrator cache and check that changes are reflected
+    # immediately instead of waiting for the cache to expire.
+    assert not admin_service.is_admin("example")
+    admin_service.add_admin("example", actor="admin", ip_address="127.0.0.1")
+    assert admin_service.is_admin("example")
+    admin_service.delete_admin(
+        "example", actor="admin", ip_address="127.0.0.1"
+    )
+    assert not admin_service.is_admin("example")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,6 +20,17 @@ if TYPE_CHECKING:
 __all__ = ["build_settings", "build_settings_file", "store_secret"]
 
 
+@lru_cache(maxsize=1)
+def _issuer_key() -> bytes:
+    """Return a PEM-encoded issuer key, generated once per test session.
+
+    RSA key generation is slow enough to dominate per-test setup time, and
+    every test can safely share the same issuer key, so generate it lazily
+    and then reuse it.
+    """
+    return RSAKeyPair.generate().private_key_as_pem()
+
+
 def _test_database_url(tmp_path: Path) -> str:
     """Determine the database URL to use for testing.
 
@@ -69,8 +81,7 @@ def build_settings(
     """
     session_secret = Fernet.generate_key()
     session_secret_file = store_secret(tmp_path, "session", session_secret)
-    issuer_key = RSAKeyPair.generate().private_key_as_pem()
-    issuer_key_file = store_secret(tmp_path, "issuer", issuer_key)
+    issuer_key_file = store_secret(tmp_path, "issuer", _issuer_key())
     influxdb_secret_file = store_secret(tmp_path, "influxdb", b"influx-secret")
     github_secret_file = store_secret(tmp_path, "github", b"github-secret")
     oidc_secret_file = store_secret(tmp_path, "oidc", b"oidc-secret")
@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import os
+import sqlite3
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from unittest.mock import ANY
 from urllib.parse import parse_qs, urljoin, urlparse
 
 import structlog
 from asgi_lifespan import LifespanManager
-from httpx import AsyncClient
+from httpx import URL, ASGITransport, AsyncClient
 from pytest_httpx import to_response
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from gafaelfawr.constants import COOKIE_NAME
@@ -24,17 +27,20 @@ from gafaelfawr.main import app
 from gafaelfawr.models.state import State
 from gafaelfawr.models.token import Token, TokenData, TokenGroup, TokenUserInfo
 from gafaelfawr.providers.github import GitHubProvider
+from gafaelfawr.services.admin import AdminService
 from gafaelfawr.storage.transaction import TransactionManager
+from gafaelfawr.verify import TokenVerifier
 from tests.support.constants import TEST_HOSTNAME
 from tests.support.settings import build_settings
 from tests.support.tokens import create_upstream_oidc_token
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Any, AsyncIterator, Dict, List, Optional
+    from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
     from aioredis import Redis
     from httpx import Request
+    from httpx import Response as ClientResponse
     from pytest_httpx import HTTPXMock
     from pytest_httpx._httpx_internals import Response
 
@@ -46,6 +52,48 @@ if TYPE_CHECKING:
     from gafaelfawr.tokens import VerifiedToken
 
 
+_JWKS_CACHE: Dict[Tuple[RSAKeyPair, str], Dict[str, Any]] = {}
+"""Cache of serialized JWKS responses, keyed by the key pair and kid.
+
+Serializing a public key to JWKS form requires extracting the RSA public
+numbers, which is slow enough to be worth skipping for the repeated
+registrations done by nearly every OpenID Connect test.  The key pair
+hashes by identity, so keying by the object also pins it, preventing a
+later key pair from reusing its id.
+"""
+
+_TRANSPORT = ASGITransport(app=app)
+"""Shared ASGI transport connecting test clients to the application.
+
+The transport only holds a reference to the process-global application, so
+it can be built once and reused by every test's client.
+"""
+
+
+@lru_cache(maxsize=8)
+def _database_scheme(url: str) -> str:
+    """Return the scheme of a database URL, memoized."""
+    return urlparse(url).scheme
+
+
+@event.listens_for(Engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Disable SQLite durability guarantees for the test database.
+
+    The test database is recreated for every test, so there is no value in
+    fsync calls or an on-disk journal.  This is registered for every engine
+    because the application creates its own engines; non-SQLite connections
+    are left alone.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 def initialize(tmp_path: Path) -> Config:
     """Do basic initialization and return a configuration.
 
@@ -69,9 +117,19 @@ def initialize(tmp_path: Path) -> Config:
     if not os.environ.get("REDIS_6379_TCP_PORT"):
         redis_dependency.is_mocked = True
 
+    # Tests reuse the same issuer URL and key IDs with varying mocked key
+    # responses, so the process-global verification caches must be cleared
+    # between tests.
+    TokenVerifier._key_cache.clear()
+    TokenVerifier._token_cache.clear()
+
+    # Each test starts from a fresh database, so the cached administrator set
+    # from a previous test must be discarded.
+    AdminService._admin_cache.clear()
+
     # Initialize the database.  Non-SQLite databases need to be reset between
     # tests.
-    should_reset = not urlparse(config.database_url).scheme == "sqlite"
+    should_reset = _database_scheme(config.database_url) != "sqlite"
     initialize_database(config, reset=should_reset)
 
     return config
@@ -120,7 +178,7 @@ class SetupTest:
         # the factory it contains.  The application will use a separate
         # session handled by its middleware.
         connect_args = {}
-        if urlparse(config.database_url).scheme == "sqlite":
+        if _database_scheme(config.database_url) == "sqlite":
             connect_args = {"check_same_thread": False}
         engine = create_engine(config.database_url, connect_args=connect_args)
         session = Session(bind=engine)
@@ -130,7 +188,9 @@ class SetupTest:
         try:
             async with LifespanManager(app):
                 base_url = f"https://{TEST_HOSTNAME}"
-                async with AsyncClient(app=app, base_url=base_url) as client:
+                async with AsyncClient(
+                    transport=_TRANSPORT, base_url=base_url
+                ) as client:
                     yield cls(
                         tmp_path=tmp_path,
                         httpx_mock=httpx_mock,
@@ -161,26 +221,31 @@ class SetupTest:
         self.session = session
         self.logger = structlog.get_logger(config.safir.logger_name)
         assert self.logger
+        self._factory: Optional[ComponentFactory] = None
+        self._transaction_manager = TransactionManager(session)
 
     @property
     def factory(self) -> ComponentFactory:
         """Return a `~gafaelfawr.factory.ComponentFactory`.
 
-        Build a new one each time to ensure that it picks up the current
-        configuration information.
+        Constructed on first access and then reused, but discarded when the
+        configuration is changed with `configure` so that new components
+        pick up the new configuration.
 
         Returns
         -------
         factory : `gafaelfawr.factory.ComponentFactory`
-            Newly-created factory.
+            The factory.
         """
-        return ComponentFactory(
-            config=self.config,
-            redis=self.redis,
-            http_client=self.client,
-            session=self.session,
-            logger=self.logger,
-        )
+        if not self._factory:
+            self._factory = ComponentFactory(
+                config=self.config,
+                redis=self.redis,
+                http_client=self.client,
+                session=self.session,
+                logger=self.logger,
+            )
+        return self._factory
 
     def configure(
         self,
@@ -211,6 +276,7 @@ class SetupTest:
         )
         config_dependency.set_settings_path(str(settings_path))
         self.config = config_dependency()
+        self._factory = None
 
     async def create_session_token(
         self,
@@ -289,6 +355,55 @@ class SetupTest:
             self.config, kid, groups=groups, **claims
         )
 
+    async def github_login(
+        self,
+        user_info: GitHubUserInfo,
+        *,
+        return_url: str = "https://example.com",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> ClientResponse:
+        """Simulate a completed GitHub login.
+
+        Perform the initial authentication request and the return from
+        GitHub, leaving a valid session cookie on the `httpx.AsyncClient`.
+        Tests that care about the intermediate redirect or the login route
+        parameters should make the requests themselves instead.
+
+        Parameters
+        ----------
+        user_info : `gafaelfawr.providers.github.GitHubUserInfo`
+            User information to use to synthesize GitHub API responses.
+        return_url : `str`, optional
+            Return URL to send with the initial authentication request.
+        headers : Dict[`str`, `str`], optional
+            Additional headers to send with both requests.
+
+        Returns
+        -------
+        response : `httpx.Response`
+            The response from the return from GitHub, normally a 307 redirect
+            to the return URL.
+        """
+        if headers is None:
+            headers = {}
+        self.set_github_token_response("some-code", "some-github-token")
+        r = await self.client.get(
+            "/login",
+            params={"rd": return_url},
+            headers=headers,
+            allow_redirects=False,
+        )
+        assert r.status_code == 307
+        url = urlparse(r.headers["Location"])
+        query = parse_qs(url.query)
+        self.set_github_userinfo_response("some-github-token", user_info)
+        return await self.client.get(
+            "/login",
+            params={"code": "some-code", "state": query["state"][0]},
+            headers=headers,
+            allow_redirects=False,
+        )
+
     async def login(self, token: Token) -> str:
         """Create a valid Gafaelfawr session.
 
@@ -329,38 +444,34 @@ class SetupTest:
         """
         assert self.config.github
 
-        def callback(request: Request, extensions: Dict[str, Any]) -> Response:
-            assert request.headers["Authorization"] == f"token {token}"
-            assert request.method == "GET"
-            if str(request.url) == GitHubProvider._USER_URL:
-                return to_response(
-                    json={
-                        "login": user_info.username,
-                        "id": user_info.uid,
-                        "name": user_info.name,
-                    }
-                )
-            elif str(request.url) == GitHubProvider._TEAMS_URL:
-                teams = []
-                for team in user_info.teams:
-                    data = {
-                        "slug": team.slug,
-                        "id": team.gid,
-                        "organization": {"login": team.organization},
-                    }
-                    teams.append(data)
-                return to_response(json=teams)
-            elif str(request.url) == GitHubProvider._EMAILS_URL:
-                return to_response(
-                    json=[
-                        {"email": "otheremail@example.com", "primary": False},
-                        {"email": user_info.email, "primary": True},
-                    ]
-                )
-            else:
-                assert False, f"unexpected request for {request.url}"
-
-        self.httpx_mock.add_callback(callback)
+        # The payloads are static, so register a response per URL rather
+        # than a callback that dispatches on the request URL for each call.
+        responses = {
+            GitHubProvider._USER_URL: {
+                "login": user_info.username,
+                "id": user_info.uid,
+                "name": user_info.name,
+            },
+            GitHubProvider._TEAMS_URL: [
+                {
+                    "slug": t.slug,
+                    "id": t.gid,
+                    "organization": {"login": t.organization},
+                }
+                for t in user_info.teams
+            ],
+            GitHubProvider._EMAILS_URL: [
+                {"email": "otheremail@example.com", "primary": False},
+                {"email": user_info.email, "primary": True},
+            ],
+        }
+        for url, payload in responses.items():
+            self.httpx_mock.add_response(
+                url=url,
+                method="GET",
+                match_headers={"Authorization": f"token {token}"},
+                json=payload,
+            )
 
     def set_github_token_response(self, code: str, token: str) -> None:
         """Set the token that will be returned GitHub token endpoint.
@@ -374,24 +485,26 @@ class SetupTest:
             endpoings.
         """
 
+        assert self.config.github
+        expected_body = {
+            "client_id": [self.config.github.client_id],
+            "client_secret": [self.config.github.client_secret],
+            "code": [code],
+            "state": [ANY],
+        }
+        response = {
+            "access_token": token,
+            "scope": ",".join(GitHubProvider._SCOPES),
+            "token_type": "bearer",
+        }
+        token_url = URL(GitHubProvider._TOKEN_URL)
+
         def callback(request: Request, extensions: Dict[str, Any]) -> Response:
-            assert self.config.github
-            assert str(request.url) == GitHubProvider._TOKEN_URL
+            assert request.url == token_url
             assert request.method == "POST"
             assert request.headers["Accept"] == "application/json"
-            assert parse_qs(request.read().decode()) == {
-                "client_id": [self.config.github.client_id],
-                "client_secret": [self.config.github.client_secret],
-                "code": [code],
-                "state": [ANY],
-            }
-            return to_response(
-                json={
-                    "access_token": token,
-                    "scope": ",".join(GitHubProvider._SCOPES),
-                    "token_type": "bearer",
-                }
-            )
+            assert parse_qs(request.read().decode()) == expected_body
+            return to_response(json=response)
 
         self.httpx_mock.add_callback(callback)
 
@@ -414,14 +527,16 @@ class SetupTest:
         config_url = urljoin(iss, "/.well-known/openid-configuration")
         jwks_url = urljoin(iss, "/jwks.json")
         oidc_kid = kid if kid else self.config.oidc.key_ids[0]
-        jwks = keypair.public_key_as_jwks(oidc_kid)
+        cache_key = (keypair, oidc_kid)
+        jwks = _JWKS_CACHE.get(cache_key)
+        if jwks is None:
+            jwks = keypair.public_key_as_jwks(oidc_kid).dict()
+            _JWKS_CACHE[cache_key] = jwks
 
         self.httpx_mock.add_response(
             url=config_url, method="GET", json={"jwks_uri": jwks_url}
         )
-        self.httpx_mock.add_response(
-            url=jwks_url, method="GET", json=jwks.dict()
-        )
+        self.httpx_mock.add_response(url=jwks_url, method="GET", json=jwks)
 
     def set_oidc_token_response(self, code: str, token: OldToken) -> None:
         """Set the token that will be returned from the OIDC token endpoint.
@@ -434,20 +549,23 @@ class SetupTest:
             The token.
         """
 
+        assert self.config.oidc
+        token_url = URL(self.config.oidc.token_url)
+        expected_body = {
+            "grant_type": ["authorization_code"],
+            "client_id": [self.config.oidc.client_id],
+            "client_secret": [self.config.oidc.client_secret],
+            "code": [code],
+            "redirect_uri": [self.config.oidc.redirect_url],
+        }
+
         def callback(request: Request, extensions: Dict[str, Any]) -> Response:
-            assert self.config.oidc
-            if str(request.url) != self.config.oidc.token_url:
+            if request.url != token_url:
                 assert request.method == "GET"
                 return to_response(status_code=404)
             assert request.method == "POST"
             assert request.headers["Accept"] == "application/json"
-            assert parse_qs(request.read().decode()) == {
-                "grant_type": ["authorization_code"],
-                "client_id": [self.config.oidc.client_id],
-                "client_secret": [self.config.oidc.client_secret],
-                "code": [code],
-                "redirect_uri": [self.config.oidc.redirect_url],
-            }
+            assert parse_qs(request.read().decode()) == expected_body
             return to_response(
                 json={"id_token": token.encoded, "token_type": "Bearer"}
             )
@@ -463,4 +581,4 @@ class SetupTest:
             A context manager that will automatically commit changes to
             the underlying database.
         """
-        return TransactionManager(self.session).transaction()
+        return self._transaction_manager.transaction()
@@ -11,12 +11,23 @@ from gafaelfawr.constants import ALGORITHM
 from gafaelfawr.models.oidc import OIDCVerifiedToken
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Optional
+    from typing import Any, Dict, List, Optional, Tuple
 
     from gafaelfawr.config import Config
 
 __all__ = ["create_test_token", "create_upstream_oidc_token"]
 
+_UPSTREAM_TOKEN_CACHE: Dict[Tuple[Any, ...], OIDCVerifiedToken] = {}
+"""Cache of upstream tokens, keyed by the signing key and claims.
+
+RSA signing is the dominant cost of creating an upstream token, and many
+tests request the same token, so reuse previously-signed tokens when the
+arguments allow it.  The key pair object itself (which hashes by identity)
+is part of the key, which also pins it so that a later key pair cannot
+reuse its id.  The generated expiration is weeks out, so reusing a token
+signed earlier in the test session is harmless.
+"""
+
 
 def create_test_token(
     config: Config,
@@ -112,10 +123,31 @@ def create_upstream_oidc_token(
         The new token.
     """
     assert config.oidc
+    cache_key = (
+        config.issuer.keypair,
+        config.oidc.issuer,
+        config.oidc.audience,
+        kid,
+        tuple(groups) if groups else None,
+        tuple(sorted(claims.items())),
+    )
+    cacheable = True
+    token: Optional[OIDCVerifiedToken] = None
+    try:
+        token = _UPSTREAM_TOKEN_CACHE.get(cache_key)
+    except TypeError:
+        # Claim values may be unhashable (group membership lists).
+        cacheable = False
+    if token:
+        return token
+
     payload = {
         "aud": config.oidc.audience,
         "iss": config.oidc.issuer,
         "jti": "some-upstream-id",
     }
     payload.update(claims)
-    return create_test_token(config, groups=groups, kid=kid, **payload)
+    token = create_test_token(config, groups=groups, kid=kid, **payload)
+    if cacheable:
+        _UPSTREAM_TOKEN_CACHE[cache_key] = token
+    return token
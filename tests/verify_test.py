@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin
@@ -13,12 +15,15 @@ from jwt.exceptions import InvalidIssuerError
 from gafaelfawr.constants import ALGORITHM
 from gafaelfawr.exceptions import (
     FetchKeysException,
+    InvalidTokenError,
     MissingClaimsException,
     UnknownAlgorithmException,
     UnknownKeyIdException,
 )
 from gafaelfawr.keypair import RSAKeyPair
 from gafaelfawr.models.oidc import OIDCToken
+from gafaelfawr.verify import TokenVerifier
+from tests.support.tokens import create_test_token
 
 if TYPE_CHECKING:
     from typing import Any, Dict, Optional
@@ -95,8 +100,8 @@ async def test_verify_oidc(setup: SetupTest) -> None:
     expected = f"No {setup.config.verifier.username_claim} claim in token"
     assert str(excinfo.value) == expected
 
-    # Missing UID claim.
-    setup.set_oidc_configuration_response(keypair)
+    # Missing UID claim.  The issuer key is cached from the previous
+    # verification, so no new key retrieval happens here.
     payload[setup.config.verifier.username_claim] = "some-user"
     token = encode_token(payload, setup.config.issuer.keypair, kid=kid)
     with pytest.raises(MissingClaimsException) as excinfo:
@@ -145,9 +150,13 @@ async def test_key_retrieval(setup: SetupTest) -> None:
     token = setup.create_upstream_oidc_token(kid="some-kid")
     assert await verifier.verify_oidc_token(token)
 
-    # Wrong algorithm for the key.
+    # Wrong algorithm for the key.  The key is cached from the previous
+    # verification, so verification succeeds until the cache is cleared and a
+    # new retrieval is forced.
     jwks.keys[0].alg = "ES256"
     setup.httpx_mock.add_response(url=jwks_url, method="GET", json=jwks.dict())
+    assert await verifier.verify_oidc_token(token)
+    TokenVerifier._key_cache.clear()
     with pytest.raises(UnknownAlgorithmException):
         await verifier.verify_oidc_token(token)
 
@@ -188,3 +197,24 @@ async def test_key_retrieval(setup: SetupTest) -> None:
         url=oidc_url, method="GET", json={"jwks_uri": jwks_url}
     )
     assert await verifier.verify_oidc_token(token)
+
+
+@pytest.mark.asyncio
+async def test_verify_internal_token_cache(setup: SetupTest) -> None:
+    verifier = setup.factory.create_token_verifier()
+    token = create_test_token(setup.config)
+
+    # The second verification of the same encoded token should return the
+    # cached result of the first.
+    verified = verifier.verify_internal_token(OIDCToken(encoded=token.encoded))
+    second = verifier.verify_internal_token(OIDCToken(encoded=token.encoded))
+    assert second is verified
+
+    # A cached token whose expiration has passed must not be served from the
+    # cache.  Simulate a token that was cached while valid and has since
+    # expired and check that verification is redone (and now fails).
+    expired = create_test_token(setup.config, exp=int(time.time() - 60))
+    key = hashlib.blake2b(expired.encoded.encode(), digest_size=16).digest()
+    TokenVerifier._token_cache[key] = expired
+    with pytest.raises(InvalidTokenError):
+        verifier.verify_internal_token(OIDCToken(encoded=expired.encoded))